@@ -1574,6 +1574,7 @@ class LudwigModel:
             combiner_def=config['combiner'],
             output_features_def=config['output_features'],
             random_seed=random_seed,
+            mixed_precision=config.get(TRAINING, {}).get('mixed_precision'),
         )
 
     @staticmethod
@@ -4,6 +4,26 @@ from ludwig.utils.fs_utils import checksum
 from ludwig.utils.misc_utils import hash_dict
 
 
+def _vocab_file_checksums(config, features):
+    # tokenizer vocabularies live outside of the config, so their contents
+    # need to be part of the key for the cached preprocessed data to be valid
+    all_preprocessing = [feature.get(PREPROCESSING, {}) for feature in features]
+    all_preprocessing += list(config.get('preprocessing', {}).values())
+
+    vocab_files = set()
+    for preprocessing in all_preprocessing:
+        if not isinstance(preprocessing, dict):
+            continue
+        for param, value in preprocessing.items():
+            if param.endswith('vocab_file') and value:
+                vocab_files.add(value)
+
+    return {
+        vocab_file: checksum(vocab_file)
+        for vocab_file in sorted(vocab_files)
+    }
+
+
 def calculate_checksum(original_dataset, config):
     features = config.get('input_features', []) + \
                config.get('output_features', []) + \
@@ -17,5 +37,6 @@ def calculate_checksum(original_dataset, config):
         'feature_preprocessing': [
             feature.get(PREPROCESSING, {}) for feature in features
         ],
+        'vocab_file_checksums': _vocab_file_checksums(config, features),
     }
     return hash_dict(info, max_length=None).decode('ascii')
@@ -20,6 +20,7 @@ import math
 import tensorflow as tf
 from ludwig.data.dataset.pandas import PandasDataset
 from ludwig.data.dataset.ray import RayDataset
+from ludwig.data.dataset.tfrecord import AUTOTUNE
 from ludwig.utils.data_utils import DATA_TRAIN_HDF5_FP
 
 from petastorm import make_batch_reader
@@ -85,6 +86,9 @@ class ParquetDataset(Dataset):
                 buffer_size = shuffle_buffer_size or min(rows_per_piece, local_samples)
                 dataset = dataset.shuffle(buffer_size)
             dataset = dataset.batch(batch_size)
+            # prepare the next batches in the background while the current
+            # one is being trained on
+            dataset = dataset.prefetch(AUTOTUNE)
 
             steps_per_epoch = math.ceil(local_samples / batch_size)
 
@@ -6,6 +6,9 @@ from zipfile import ZipFile
 
 from ludwig.utils.fs_utils import upload_output_directory
 
+# Written once the archive is fully downloaded and extracted
+DOWNLOAD_READY_FILENAME = '.ready'
+
 
 def create_kaggle_client():
     # Need to import here to prevent Kaggle from authenticating on import
@@ -33,6 +36,9 @@ class KaggleDownloadMixin:
         kaggle.json file we lookup the passed in username and the api key and
         perform authentication.
         """
+        if self.is_downloaded():
+            return
+
         with self.update_env(KAGGLE_USERNAME=self.kaggle_username, KAGGLE_KEY=self.kaggle_key):
             # Call authenticate explicitly to pick up new credentials if necessary
             api = create_kaggle_client()
@@ -50,6 +56,15 @@ class KaggleDownloadMixin:
             with ZipFile(archive_zip, 'r') as z:
                 z.extractall(tmpdir)
 
+            # the marker is only created once the archive is fully
+            # extracted, so that an interrupted download is never mistaken
+            # for a complete one
+            open(os.path.join(tmpdir, DOWNLOAD_READY_FILENAME), 'w').close()
+
+    def is_downloaded(self) -> bool:
+        return self.is_processed() or os.path.exists(
+            os.path.join(self.raw_dataset_path, DOWNLOAD_READY_FILENAME))
+
     @contextmanager
     def update_env(self, **kwargs):
         override_env = {k: v for k, v in kwargs.items() if v is not None}
@@ -16,9 +16,11 @@
 # ==============================================================================
 
 import os
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 
 from ludwig.constants import SPLIT
 
@@ -38,6 +40,54 @@ def _split(data_df, split):
     return data_df
 
 
+def read_csv_table(path) -> Optional[pa.Table]:
+    """Reads a CSV file into an Arrow table with the multithreaded pyarrow
+    parser.
+
+    Returns None when the file has to be read with pandas instead: when the
+    header has empty or duplicate column names, which pandas renames, or when
+    a column does not fit the type inferred from the first block of the file.
+    """
+    block_size = 1 << 22
+    read_options = pv.ReadOptions(use_threads=True, block_size=block_size)
+
+    # keep dates and times as strings, the date feature takes care of parsing
+    # them, their types are inferred from the first block only like read_csv
+    with open(path, 'rb') as f:
+        schema = pv.open_csv(
+            f,
+            read_options=pv.ReadOptions(use_threads=False,
+                                        block_size=block_size)
+        ).schema
+    if '' in schema.names or len(set(schema.names)) < len(schema.names):
+        return None
+    column_types = {
+        field.name: pa.string() for field in schema
+        if (pa.types.is_timestamp(field.type) or
+            pa.types.is_date(field.type) or
+            pa.types.is_time(field.type))
+    }
+    convert_options = pv.ConvertOptions(column_types=column_types,
+                                        strings_can_be_null=True)
+
+    try:
+        return pv.read_csv(path,
+                           read_options=read_options,
+                           convert_options=convert_options)
+    except pa.ArrowInvalid:
+        return None
+
+
+def read_csv(path) -> pd.DataFrame:
+    """Reads a CSV file into a Pandas DataFrame like pd.read_csv does, parsing
+    it with pyarrow when possible.
+    """
+    table = read_csv_table(path)
+    if table is None:
+        return pd.read_csv(path)
+    return table.to_pandas()
+
+
 class CSVLoadMixin:
     """Reads a CSV file into a Pandas DataFrame."""
 
@@ -53,7 +103,7 @@ class CSVLoadMixin:
         :param split: Splits along 'split' column if present
         :returns: A pandas dataframe
         """
-        data_df = pd.read_csv(self.dataset_path)
+        data_df = read_csv(self.dataset_path)
         return _split(data_df, split)
 
     @property
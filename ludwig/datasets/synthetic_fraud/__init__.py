@@ -15,11 +15,15 @@
 # limitations under the License.
 # ==============================================================================
 import os
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
 from ludwig.datasets.base_dataset import BaseDataset, DEFAULT_CACHE_LOCATION
 from ludwig.datasets.mixins.kaggle import KaggleDownloadMixin
-from ludwig.datasets.mixins.load import CSVLoadMixin
-from ludwig.datasets.mixins.process import IdentityProcessMixin
+from ludwig.datasets.mixins.load import ParquetLoadMixin, read_csv_table
+from ludwig.utils.fs_utils import delete, makedirs, rename
 
 
 def load(cache_dir=DEFAULT_CACHE_LOCATION, split=False, kaggle_username=None, kaggle_key=None):
@@ -31,7 +35,7 @@ def load(cache_dir=DEFAULT_CACHE_LOCATION, split=False, kaggle_username=None, ka
     return dataset.load(split=split)
 
 
-class SyntheticFraud(CSVLoadMixin, IdentityProcessMixin, KaggleDownloadMixin, BaseDataset):
+class SyntheticFraud(ParquetLoadMixin, KaggleDownloadMixin, BaseDataset):
     """The Synthetic Financial Datasets For Fraud Detection dataset.
 
     Additional details:
@@ -47,3 +51,31 @@ class SyntheticFraud(CSVLoadMixin, IdentityProcessMixin, KaggleDownloadMixin, Ba
         self.kaggle_key = kaggle_key
         self.is_kaggle_competition = False
         super().__init__(dataset_name='synthetic_fraud', cache_dir=cache_dir)
+
+    def process_downloaded_dataset(self):
+        """Converts the downloaded CSV to Parquet once, so that every
+        following load reads columnar data instead of parsing the CSV again.
+        The raw download is deleted afterwards, as the CSV is only needed
+        once to build the Parquet file.
+        """
+        csv_path = os.path.join(self.raw_dataset_path, self.csv_filename)
+        table = read_csv_table(csv_path)
+        if table is None:
+            table = pa.Table.from_pandas(pd.read_csv(csv_path),
+                                         preserve_index=False)
+
+        makedirs(self.processed_temp_path, exist_ok=True)
+        pq.write_table(
+            table,
+            os.path.join(self.processed_temp_path, self.parquet_filename),
+            compression='snappy',
+            use_dictionary=True,
+            row_group_size=262144
+        )
+
+        rename(self.processed_temp_path, self.processed_dataset_path)
+        delete(self.raw_dataset_path, recursive=True)
+
+    @property
+    def csv_filename(self):
+        return self.config["csv_filename"]
@@ -82,12 +82,12 @@ class CategoryFeatureMixin:
 
     @staticmethod
     def feature_data(column, metadata):
-        return column.map(
-            lambda x: (
-                metadata['str2idx'][x.strip()]
-                if x.strip() in metadata['str2idx']
-                else metadata['str2idx'][UNKNOWN_SYMBOL]
-            )
+        # vectorized dictionary lookup instead of a per-row Python lambda,
+        # values missing from the vocabulary are mapped to the unknown symbol
+        return column.str.strip().map(
+            metadata['str2idx']
+        ).fillna(
+            metadata['str2idx'][UNKNOWN_SYMBOL]
         ).astype(int_type(metadata['vocab_size']))
 
     @staticmethod
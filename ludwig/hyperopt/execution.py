@@ -11,7 +11,7 @@ import threading
 import time
 import warnings
 from abc import ABC, abstractmethod
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import Union, Optional
 
 from ludwig.api import LudwigModel
@@ -58,8 +58,8 @@ def _is_ray_backend(backend) -> bool:
     return isinstance(backend, RayBackend)
 
 
-def _get_relative_checkpoints_dir_parts(path: Path):
-    return path.parts[-2:]
+def _get_relative_checkpoints_dir_parts(path: Union[str, PurePath]):
+    return PurePath(path).parts[-2:]
 
 
 class HyperoptExecutor(ABC):
@@ -11,6 +11,7 @@ from ludwig.features.feature_registries import input_type_registry, \
 from ludwig.utils.algorithms_utils import topological_sort_feature_dependencies
 from ludwig.utils.data_utils import clear_data_cache
 from ludwig.utils.misc_utils import get_from_registry
+from ludwig.utils.tf_utils import mixed_precision_scope
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ class ECD(tf.keras.Model):
             combiner_def,
             output_features_def,
             random_seed=None,
+            mixed_precision=None,
     ):
         # Deep copy to prevent TensorFlow from hijacking the dicts within the config and
         # transforming them into _DictWrapper classes, which are not JSON serializable.
@@ -31,24 +33,33 @@ class ECD(tf.keras.Model):
         self._output_features_df = copy.deepcopy(output_features_def)
 
         self._random_seed = random_seed
+        self._mixed_precision = mixed_precision
 
         if random_seed is not None:
             tf.random.set_seed(random_seed)
 
         super().__init__()
 
-        # ================ Inputs ================
-        self.input_features = build_inputs(
-            input_features_def
-        )
-
-        # ================ Combiner ================
-        logger.debug('Combiner {}'.format(combiner_def[TYPE]))
-        combiner_class = get_combiner_class(combiner_def[TYPE])
-        self.combiner = combiner_class(
-            input_features=self.input_features,
-            **combiner_def,
-        )
+        # Encoders and combiner compute in reduced precision, while the
+        # output features are kept in float32 for numerically stable losses.
+        with mixed_precision_scope(mixed_precision):
+            # ================ Inputs ================
+            self.input_features = build_inputs(
+                input_features_def
+            )
+            # raw inputs keep their dtype, the features validate and cast
+            # them, while the encoder layers within compute in reduced
+            # precision
+            for input_feature in self.input_features.values():
+                input_feature._autocast = False
+
+            # ================ Combiner ================
+            logger.debug('Combiner {}'.format(combiner_def[TYPE]))
+            combiner_class = get_combiner_class(combiner_def[TYPE])
+            self.combiner = combiner_class(
+                input_features=self.input_features,
+                **combiner_def,
+            )
 
         # ================ Outputs ================
         self.output_features = build_outputs(
@@ -288,7 +299,9 @@ class ECD(tf.keras.Model):
         return weights
 
     def get_args(self):
-        return self._input_features_df, self._combiner_def, self._output_features_df, self._random_seed
+        return (self._input_features_df, self._combiner_def,
+                self._output_features_df, self._random_seed,
+                self._mixed_precision)
 
     def __setstate__(self, newstate):
         self.set_weights(newstate['weights'])
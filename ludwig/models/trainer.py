@@ -48,7 +48,8 @@ from ludwig.utils.horovod_utils import initialize_horovod, return_first
 from ludwig.utils.math_utils import (exponential_decay, learning_rate_warmup,
                                      learning_rate_warmup_distributed)
 from ludwig.utils.misc_utils import set_random_seed
-from ludwig.utils.tf_utils import initialize_tensorflow
+from ludwig.utils.tf_utils import (initialize_tensorflow, jit_compile_scope,
+                                   mixed_precision_policy_registry)
 from tabulate import tabulate
 from tqdm import tqdm
 
@@ -141,6 +142,8 @@ class Trainer(BaseTrainer):
             random_seed=default_random_seed,
             horovod=None,
             debug=False,
+            jit_compile=False,
+            mixed_precision=None,
             **kwargs
     ):
         """Trains a model with a set of hyperparameters listed below. Customizable
@@ -236,6 +239,19 @@ class Trainer(BaseTrainer):
         :type: list
         :param random_seed: Default initialization for the random seeds
         :type: Float
+        :param jit_compile: compiles the graphs of the training steps, and of
+               the validation and test evaluations run during training, with
+               XLA, fusing elementwise operations and removing per-op
+               dispatch overhead. `LudwigModel.evaluate` and `predict` are
+               not compiled. Works best when batch shapes are static, as
+               every new input shape triggers a recompilation.
+        :type jit_compile: Boolean
+        :param mixed_precision: runs encoders and combiner in reduced
+               precision, either `fp16` (with dynamic loss scaling) or
+               `bf16`, keeping weights and output features in float32.
+               Not every op has reduced precision kernels on every device,
+               e.g. convolutions have no `bf16` CPU kernel.
+        :type mixed_precision: str
         """
         self.epochs = epochs
         self.regularization_lambda = regularization_lambda
@@ -271,6 +287,8 @@ class Trainer(BaseTrainer):
         self.random_seed = random_seed
         self.horovod = horovod
         self.debug = debug
+        self.jit_compile = jit_compile
+        self.mixed_precision = mixed_precision
         self.received_sigint = False
         self.callbacks = callbacks or []
 
@@ -282,6 +300,8 @@ class Trainer(BaseTrainer):
             optimizer = {TYPE: 'Adam'}
         self.optimizer = ClippedOptimizer(
             horovod=horovod,
+            loss_scale=mixed_precision_policy_registry.get(
+                mixed_precision) == 'mixed_float16',
             **optimizer
         )
 
@@ -753,7 +773,7 @@ class Trainer(BaseTrainer):
             shuffle_buffer_size=self.shuffle_buffer_size,
             seed=self.random_seed,
             horovod=self.horovod,
-        ) as batcher:
+        ) as batcher, jit_compile_scope(self.jit_compile):
 
             # ================ Training Loop ================
             first_batch = True
@@ -37,27 +37,60 @@ def ClippedOptimizer(type='sgd',
                      clipnorm=None,
                      clipvalue=None,
                      horovod=None,
+                     loss_scale=False,
                      **kwargs):
     optimizer = get_from_registry(type.lower(), optimizers_registry)(**kwargs)
     return clip_optimizer(optimizer, clipglobalnorm, clipnorm, clipvalue,
-                          horovod=horovod)
+                          horovod=horovod, loss_scale=loss_scale)
+
+
+def _scale_gradient(gradient, factor):
+    if gradient is None:
+        return None
+    if isinstance(gradient, tf.IndexedSlices):
+        return tf.IndexedSlices(
+            gradient.values * tf.cast(factor, gradient.values.dtype),
+            gradient.indices,
+            gradient.dense_shape
+        )
+    return gradient * tf.cast(factor, gradient.dtype)
 
 
 def clip_optimizer(optimizer, clipglobalnorm, clipnorm, clipvalue,
-                   horovod=None):
+                   horovod=None, loss_scale=False):
     class _ClippedOptimizer(tf.keras.optimizers.Optimizer):
         def __init__(self, **kwargs):
             self.clipglobalnorm = clipglobalnorm
             self.clipnorm = clipnorm
             self.clipvalue = clipvalue
             self.horovod = horovod
+            self.loss_scale = None
             super(self.__class__, self).__init__(**kwargs)
+            if loss_scale:
+                self.loss_scale = \
+                    tf.mixed_precision.experimental.DynamicLossScale()
+                # optimizers do not track their attributes, the loss scale
+                # is saved in checkpoints so that resuming keeps it
+                self._track_trackable(self.loss_scale, 'loss_scale')
 
         def minimize_with_tape(self, tape, loss, variables):
+            if self.loss_scale is not None:
+                # scale the loss up so that small float16 gradients
+                # do not underflow to zero
+                scale = self.loss_scale()
+                with tape:
+                    loss = loss * tf.cast(scale, loss.dtype)
+
             if self.horovod:
                 tape = self.horovod.DistributedGradientTape(tape)
 
             gradients = tape.gradient(loss, variables)
+            if self.loss_scale is not None:
+                # unscale the gradients and adjust the loss scale, the
+                # update is skipped for the steps where they overflowed
+                _, should_apply = self.loss_scale.update(gradients)
+                gradients = [_scale_gradient(g, 1.0 / scale)
+                             for g in gradients]
             if self.clipglobalnorm:
                 gradients, _ = tf.clip_by_global_norm(gradients,
                                                       self.clipglobalnorm)
@@ -75,7 +108,19 @@ def clip_optimizer(optimizer, clipglobalnorm, clipnorm, clipvalue,
                     ),
                     gradients
                 )
-            self.apply_gradients(zip(gradients, variables))
+            grads_and_vars = list(zip(gradients, variables))
+            if self.loss_scale is None:
+                self.apply_gradients(grads_and_vars)
+                return
+
+            def apply_fn():
+                self.apply_gradients(grads_and_vars)
+                return tf.constant(True)
+
+            # slots can not be created within a conditional branch, and
+            # skipping the update leaves weights, slots and iterations as is
+            self._create_all_weights(variables)
+            tf.cond(should_apply, apply_fn, lambda: tf.constant(False))
 
         def set_learning_rate(self, learning_rate):
             self.lr.assign(learning_rate)
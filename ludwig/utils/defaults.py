@@ -69,7 +69,9 @@ default_training_params = {
     'validation_field': COMBINED,
     'validation_metric': LOSS,
     'bucketing_field': None,
-    'learning_rate_warmup_epochs': 1
+    'learning_rate_warmup_epochs': 1,
+    'jit_compile': False,
+    'mixed_precision': None
 }
 
 default_optimizer_params_registry = {
@@ -35,6 +35,9 @@ def set_random_seed(random_seed):
     os.environ['PYTHONHASHSEED'] = str(random_seed)
     random.seed(random_seed)
     numpy.random.seed(random_seed)
+    # imported here to avoid loading TensorFlow with the rest of the utils
+    import tensorflow as tf
+    tf.random.set_seed(random_seed)
 
 
 def merge_dict(dct, merge_dct):
@@ -32,6 +32,9 @@ UNKNOWN_SYMBOL = '<UNK>'
 PADDING_SYMBOL = '<PAD>'
 PADDING_IDX = 0
 
+# rows encoded per call of batch_encode
+HF_BATCH_ENCODE_SIZE = 10000
+
 SPLIT_REGEX = re.compile(r'\s+')
 SPACE_PUNCTUATION_REGEX = re.compile(r'\w+|[^\w\s]')
 COMMA_REGEX = re.compile(r'\s*,\s*')
@@ -241,15 +244,33 @@ def build_sequence_matrix(
 
     format_dtype = int_type(len(inverse_vocabulary) - 1)
 
-    unit_vectors = sequences.map(lambda sequence: _get_sequence_vector(
-        sequence,
-        tokenizer,
-        tokenizer_type,
-        format_dtype,
-        inverse_vocabulary,
-        lowercase=lowercase,
-        unknown_symbol=unknown_symbol
-    ))
+    if tokenizer_type == 'hf_tokenizer' and not processor.partitioned:
+        # fast tokenizers encode a whole batch at once in native code,
+        # much quicker than going through them one row at a time. Batches
+        # are bounded, so the encodings of a large column are not all held
+        # in memory at once
+        unit_vectors = []
+        for start in range(0, len(sequences), HF_BATCH_ENCODE_SIZE):
+            batch = sequences.iloc[start:start + HF_BATCH_ENCODE_SIZE]
+            unit_vectors.extend(
+                np.array(ids, dtype=format_dtype)
+                for ids in tokenizer.batch_encode([
+                    sequence.lower() if lowercase else sequence
+                    for sequence in batch
+                ])
+            )
+        unit_vectors = processor.df_lib.Series(unit_vectors,
+                                               index=sequences.index)
+    else:
+        unit_vectors = sequences.map(lambda sequence: _get_sequence_vector(
+            sequence,
+            tokenizer,
+            tokenizer_type,
+            format_dtype,
+            inverse_vocabulary,
+            lowercase=lowercase,
+            unknown_symbol=unknown_symbol
+        ))
 
     max_length = processor.compute(unit_vectors.map(len).max())
     if max_length < length_limit:
@@ -1181,6 +1202,14 @@ class HFTokenizer(BaseTokenizer):
     def __call__(self, text):
         return self.tokenizer.encode(text, truncation=True)
 
+    def batch_encode(self, texts):
+        return self.tokenizer(
+            texts,
+            truncation=True,
+            return_attention_mask=False,
+            return_token_type_ids=False
+        )['input_ids']
+
 
 tokenizer_registry = {
     'characters': CharactersToListTokenizer,
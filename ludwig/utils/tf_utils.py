@@ -21,12 +21,21 @@ import tempfile
 import multiprocessing
 import warnings
 import zipfile
+from contextlib import contextmanager
 
 import tensorflow as tf
 from ludwig.globals import MODEL_WEIGHTS_FILE_NAME
+from ludwig.utils.misc_utils import get_from_registry
 
 _TF_INIT_PARAMS = None
 
+mixed_precision_policy_registry = {
+    'fp16': 'mixed_float16',
+    'float16': 'mixed_float16',
+    'bf16': 'mixed_bfloat16',
+    'bfloat16': 'mixed_bfloat16',
+}
+
 
 def sequence_length_3D(sequence):
     used = tf.sign(tf.reduce_max(tf.abs(sequence), 2))
@@ -123,6 +132,41 @@ def _get_tf_init_params():
     return _TF_INIT_PARAMS
 
 
+@contextmanager
+def jit_compile_scope(enabled=True):
+    """Enables XLA auto-clustering of the traced graphs within the context."""
+    if not enabled:
+        yield
+        return
+
+    prev_jit = tf.config.optimizer.get_jit()
+    tf.config.optimizer.set_jit(True)
+    try:
+        yield
+    finally:
+        tf.config.optimizer.set_jit(prev_jit)
+
+
+@contextmanager
+def mixed_precision_scope(mixed_precision=None):
+    """Builds the layers created within the context with a mixed precision
+    dtype policy: computations run in float16 / bfloat16 while variables are
+    kept in float32.
+    """
+    if not mixed_precision:
+        yield
+        return
+
+    policy = get_from_registry(mixed_precision,
+                               mixed_precision_policy_registry)
+    prev_policy = tf.keras.mixed_precision.experimental.global_policy()
+    tf.keras.mixed_precision.experimental.set_policy(policy)
+    try:
+        yield
+    finally:
+        tf.keras.mixed_precision.experimental.set_policy(prev_policy)
+
+
 def get_available_gpus_child_process(gpus_ids_queue):
     gpu_devices = tf.config.list_physical_devices('GPU')
     gpu_ids = [gpu.name.split(':')[-1] for gpu in gpu_devices]
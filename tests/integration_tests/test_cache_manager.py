@@ -83,3 +83,32 @@ def test_cache_dataset(use_cache_dir, use_split, tmpdir):
 
     for cache_path in cache_map.values():
         assert not os.path.exists(cache_path)
+
+
+def test_cache_key_vocab_file(tmpdir):
+    dataset_manager = PandasDatasetManager(backend=LocalTestBackend())
+    manager = CacheManager(dataset_manager)
+
+    vocab_file = os.path.join(tmpdir, 'vocab.txt')
+    with open(vocab_file, 'w') as f:
+        f.write('a\nb\n')
+
+    config = {
+        'input_features': [
+            sequence_feature(reduce_output='sum',
+                             preprocessing={'vocab_file': vocab_file})
+        ],
+        'output_features': [category_feature(vocab_size=2, reduce_input='sum')],
+        'combiner': {'type': 'concat', 'fc_size': 14},
+        'preprocessing': {},
+    }
+
+    dataset = os.path.join(tmpdir, 'dataset.csv')
+    Path(dataset).touch()
+    cache_key = manager.get_cache_key(dataset, config)
+    assert manager.get_cache_key(dataset, config) == cache_key
+
+    # changing the vocabulary invalidates the preprocessed data
+    with open(vocab_file, 'w') as f:
+        f.write('a\nb\nc\n')
+    assert manager.get_cache_key(dataset, config) != cache_key
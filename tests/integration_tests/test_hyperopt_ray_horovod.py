@@ -21,6 +21,7 @@ from unittest.mock import patch
 
 import pytest
 
+import pyarrow.parquet as pq
 import ray
 from ray.tune.sync_client import get_sync_client
 
@@ -33,16 +34,11 @@ from ludwig.hyperopt.run import hyperopt
 from ludwig.hyperopt.sampling import (get_build_hyperopt_sampler)
 from ludwig.hyperopt.run import update_hyperopt_params_with_defaults
 from ludwig.utils.defaults import merge_with_defaults, ACCURACY
-from tests.integration_tests.utils import create_data_set_to_use
 from tests.integration_tests.utils import binary_feature
-from tests.integration_tests.utils import generate_data
+from tests.integration_tests.utils import generate_data_arrow
 from tests.integration_tests.utils import spawn
 from tests.integration_tests.utils import numerical_feature
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-logging.getLogger("ludwig").setLevel(logging.INFO)
-
 # Ray mocks
 
 # Dummy sync templates
@@ -89,7 +85,9 @@ SAMPLERS = [
         "scheduler": {
             "type": "async_hyperband",
             "time_attr": "training_iteration",
-            "reduction_factor": 2,
+            "reduction_factor": 4,
+            "grace_period": 1,
+            "max_t": 2,
             "dynamic_resource_allocation": True,
         },
     },
@@ -108,21 +106,27 @@ SAMPLERS = [
 ]
 
 EXECUTORS = [
-    {"type": "ray"},
+    # each trial reserves a near-zero CPU bundle for its driver and a single
+    # CPU bundle for its Horovod worker, so Tune packs up to 3 trials onto
+    # the ray_start_4_cpus cluster
+    {"type": "ray", "cpu_resources_per_trial": 1},
 ]
 
 
-def _get_config(sampler, executor):
-    input_features = [
-        numerical_feature(), numerical_feature()
-    ]
-    output_features = [
-        binary_feature()
-    ]
+# Feature names are fixed, so that the shared dataset matches the features
+# rebuilt when this module is imported again by spawned subprocesses
+INPUT_FEATURES = [
+    numerical_feature(name='num_1'), numerical_feature(name='num_2')
+]
+OUTPUT_FEATURES = [
+    binary_feature(name='binary_1')
+]
+
 
+def _get_config(sampler, executor):
     return {
-        "input_features": input_features,
-        "output_features": output_features,
+        "input_features": INPUT_FEATURES,
+        "output_features": OUTPUT_FEATURES,
         "combiner": {"type": "concat", "num_fc_layers": 2},
         "training": {"epochs": 2, "learning_rate": 0.001},
         "hyperopt": {
@@ -140,9 +144,19 @@ class MockRayTuneExecutor(RayTuneExecutor):
         return mock_storage_client(remote_checkpoint_dir), remote_checkpoint_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ray_start_4_cpus():
-    address_info = ray.init(num_cpus=4)
+    # shared by all the tests in the module and started without the
+    # dashboard, which only adds startup time. log_to_driver only applies to
+    # this process, which runs no tasks: the spawned processes driving the
+    # trials connect on their own in _connect_to_ray_cluster
+    address_info = ray.init(
+        num_cpus=4,
+        include_dashboard=False,
+        log_to_driver=False,
+        object_store_memory=256 * 1024 * 1024,
+        logging_level=logging.ERROR,
+    )
     try:
         yield address_info
     finally:
@@ -158,19 +172,31 @@ def ray_mock_dir():
     finally:
         shutil.rmtree(path)
 
+@pytest.fixture(scope="session")
+def dataset_parquet(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("hyperopt_ray_horovod")
+    dataset_parquet = str(data_dir / 'dataset.parquet')
+    table = generate_data_arrow(
+        INPUT_FEATURES, OUTPUT_FEATURES, num_examples=100)
+    pq.write_table(table, dataset_parquet, row_group_size=100)
+    return dataset_parquet
+
+def _connect_to_ray_cluster():
+    # the spawned process is the driver of the trials, connect it to the
+    # cluster of the module before Ludwig does it with the default
+    # log_to_driver=True, which forwards the output of every worker to it
+    ray.init(address='auto', log_to_driver=False, logging_level=logging.ERROR)
+
+
 @spawn
 def run_hyperopt_executor(
-    sampler, executor, csv_filename, ray_mock_dir,
+    sampler, executor, dataset_parquet, ray_mock_dir,
     validate_output_feature=False,
     validation_metric=None,
 ):
-    config = _get_config(sampler, executor)
-
-    csv_filename = os.path.join(ray_mock_dir, 'dataset.csv')
-    dataset_csv = generate_data(
-        config['input_features'], config['output_features'], csv_filename, num_examples=100)
-    dataset_parquet = create_data_set_to_use('parquet', dataset_csv)
+    _connect_to_ray_cluster()
 
+    config = _get_config(sampler, executor)
     config = merge_with_defaults(config)
 
     hyperopt_config = config["hyperopt"]
@@ -212,15 +238,15 @@ def run_hyperopt_executor(
 @pytest.mark.distributed
 @pytest.mark.parametrize('sampler', SAMPLERS)
 @pytest.mark.parametrize('executor', EXECUTORS)
-def test_hyperopt_executor(sampler, executor, csv_filename, ray_start_4_cpus, ray_mock_dir):
-    run_hyperopt_executor(sampler, executor, csv_filename, ray_mock_dir)
+def test_hyperopt_executor(sampler, executor, dataset_parquet, ray_start_4_cpus, ray_mock_dir):
+    run_hyperopt_executor(sampler, executor, dataset_parquet, ray_mock_dir)
 
 
 @pytest.mark.distributed
-def test_hyperopt_executor_with_metric(csv_filename, ray_start_4_cpus, ray_mock_dir):
+def test_hyperopt_executor_with_metric(dataset_parquet, ray_start_4_cpus, ray_mock_dir):
     run_hyperopt_executor({"type": "ray", "num_samples": 2},
                           {"type": "ray"},
-                          csv_filename,
+                          dataset_parquet,
                           ray_mock_dir,
                           validate_output_feature=True,
                           validation_metric=ACCURACY)
@@ -228,27 +254,15 @@ def test_hyperopt_executor_with_metric(csv_filename, ray_start_4_cpus, ray_mock_
 
 @pytest.mark.distributed
 @patch("ludwig.hyperopt.execution.RayTuneExecutor", MockRayTuneExecutor)
-def test_hyperopt_run_hyperopt(csv_filename, ray_start_4_cpus, ray_mock_dir):
-    input_features = [
-        numerical_feature(), numerical_feature()
-    ]
-    output_features = [
-        binary_feature()
-    ]
-
-    csv_filename = os.path.join(ray_mock_dir, 'dataset.csv')
-    dataset_csv = generate_data(
-        input_features, output_features, csv_filename, num_examples=100)
-    dataset_parquet = create_data_set_to_use('parquet', dataset_csv)
-
+def test_hyperopt_run_hyperopt(dataset_parquet, ray_start_4_cpus, ray_mock_dir):
     config = {
-        "input_features": input_features,
-        "output_features": output_features,
+        "input_features": INPUT_FEATURES,
+        "output_features": OUTPUT_FEATURES,
         "combiner": {"type": "concat", "num_fc_layers": 2},
         "training": {"epochs": 4, "learning_rate": 0.001}
     }
 
-    output_feature_name = output_features[0]['name']
+    output_feature_name = OUTPUT_FEATURES[0]['name']
 
     hyperopt_configs = {
         "parameters": {
@@ -286,6 +300,8 @@ def run_hyperopt(
         experiment_name='ray_hyperopt',
         callbacks=None,
 ):
+    _connect_to_ray_cluster()
+
     hyperopt_results = hyperopt(
         config,
         dataset=rel_path,
@@ -13,12 +13,14 @@ from sklearn.model_selection import train_test_split
 from ludwig import globals as global_vars
 from ludwig.api import LudwigModel
 from ludwig.backend import LOCAL_BACKEND
+from ludwig.callbacks import Callback
 from ludwig.experiment import experiment_cli
 from ludwig.features.numerical_feature import numeric_transformation_registry
 from ludwig.modules.optimization_modules import optimizers_registry
 from ludwig.utils.data_utils import load_json, replace_file_extension
 from ludwig.utils.misc_utils import get_from_registry
-from tests.integration_tests.utils import category_feature, generate_data, LocalTestBackend
+from tests.integration_tests.utils import binary_feature, category_feature, \
+    generate_data, LocalTestBackend, numerical_feature, sequence_feature
 
 RANDOM_SEED = 42
 NUMBER_OBSERVATIONS = 500
@@ -380,6 +382,118 @@ def test_regularization(generated_data, tmp_path):
     assert len(regularization_losses) == len(regularization_losses_set)
 
 
+@pytest.mark.parametrize('mixed_precision', ['fp16', 'bf16'])
+def test_mixed_precision(mixed_precision, csv_filename, tmp_path):
+    input_features = [
+        numerical_feature(),
+        binary_feature(),
+        category_feature(vocab_size=3),
+        sequence_feature(encoder='passthrough', reduce_output='sum'),
+        sequence_feature(encoder='rnn', reduce_output='sum'),
+    ]
+    output_features = [binary_feature()]
+    data_csv = generate_data(input_features, output_features, csv_filename)
+
+    config = {
+        'input_features': input_features,
+        'output_features': output_features,
+        'combiner': {'type': 'concat', 'num_fc_layers': 2},
+        'training': {
+            'epochs': 2,
+            'batch_size': 16,
+            'mixed_precision': mixed_precision
+        }
+    }
+
+    model = LudwigModel(config, backend=LocalTestBackend())
+    train_stats, _, _ = model.train(
+        dataset=data_csv,
+        output_directory=str(tmp_path / 'results'),
+        skip_save_processed_input=True,
+        skip_save_progress=True,
+        skip_save_unprocessed_output=True,
+        skip_save_model=True,
+        skip_save_log=True
+    )
+
+    # encoders and combiner compute in reduced precision, outputs in float32
+    compute_dtype = 'float16' if mixed_precision == 'fp16' else 'bfloat16'
+    assert model.model.combiner.compute_dtype == compute_dtype
+    for input_feature in model.model.input_features.values():
+        assert input_feature.compute_dtype == compute_dtype
+    for output_feature in model.model.output_features.values():
+        assert output_feature.compute_dtype == 'float32'
+    assert tf.keras.mixed_precision.experimental.global_policy().name == \
+           'float32'
+
+    train_losses = train_stats['training']['combined']['loss']
+    assert np.isfinite(train_losses).all()
+
+    predictions, _ = model.predict(dataset=data_csv)
+    assert len(predictions) > 0
+
+
+class JitRecorder(Callback):
+    """Records whether XLA auto-clustering is on during training steps and
+    during validation."""
+
+    def __init__(self):
+        self.batch_jit = []
+        self.validation_jit = []
+
+    def on_batch_end(self, trainer, progress_tracker, save_path):
+        self.batch_jit.append(tf.config.optimizer.get_jit())
+
+    def on_validation_start(self, trainer, progress_tracker, save_path):
+        self.validation_jit.append(tf.config.optimizer.get_jit())
+
+
+def test_jit_compile(csv_filename, tmp_path):
+    input_features = [
+        numerical_feature(),
+        category_feature(vocab_size=3),
+        sequence_feature(encoder='rnn', reduce_output='sum'),
+    ]
+    output_features = [binary_feature()]
+    data_csv = generate_data(input_features, output_features, csv_filename)
+
+    config = {
+        'input_features': input_features,
+        'output_features': output_features,
+        'combiner': {'type': 'concat', 'num_fc_layers': 2},
+        'training': {
+            'epochs': 2,
+            'batch_size': 16,
+            'jit_compile': True
+        }
+    }
+
+    jit_recorder = JitRecorder()
+    model = LudwigModel(config, backend=LocalTestBackend(),
+                        callbacks=[jit_recorder])
+    train_stats, _, _ = model.train(
+        dataset=data_csv,
+        output_directory=str(tmp_path / 'results'),
+        skip_save_processed_input=True,
+        skip_save_progress=True,
+        skip_save_unprocessed_output=True,
+        skip_save_model=True,
+        skip_save_log=True
+    )
+
+    # training steps and validation run compiled, the setting is restored
+    # once training is done
+    assert jit_recorder.batch_jit and all(jit_recorder.batch_jit)
+    assert jit_recorder.validation_jit and all(jit_recorder.validation_jit)
+    assert not tf.config.optimizer.get_jit()
+
+    train_losses = train_stats['training']['combined']['loss']
+    assert np.isfinite(train_losses).all()
+
+    predictions, _ = model.predict(dataset=data_csv)
+    assert len(predictions) > 0
+
+
 # test cache checksum function
 def test_cache_checksum(csv_filename, tmp_path):
     # setup for training
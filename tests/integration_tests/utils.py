@@ -26,6 +26,7 @@ from distutils.util import strtobool
 import cloudpickle
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from ludwig.api import LudwigModel
 from ludwig.backend import LocalBackend
@@ -128,6 +129,27 @@ def generate_data(
     return filename
 
 
+def generate_data_arrow(
+        input_features,
+        output_features,
+        num_examples=25,
+):
+    """
+    Helper method to generate synthetic data based on input, output feature
+    specs directly as an in-memory Arrow table, skipping the CSV round-trip
+    :param num_examples: number of examples to generate
+    :param input_features: schema
+    :param output_features: schema
+    :return: pyarrow.Table
+    """
+    features = input_features + output_features
+    df = build_synthetic_dataset(num_examples, features)
+    data = [next(df) for _ in range(num_examples)]
+
+    columns = [pa.array(list(column)) for column in zip(*data[1:])]
+    return pa.Table.from_arrays(columns, names=data[0])
+
+
 def random_string(length=5):
     return uuid.uuid4().hex[:length].upper()
 
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import zipfile
+from shutil import copy
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from ludwig.datasets.synthetic_fraud import SyntheticFraud
+
+
+@pytest.mark.parametrize('arrow_readable', [True, False])
+def test_download_synthetic_fraud_dataset(tmpdir, arrow_readable):
+    input_df = pd.DataFrame({
+        'step': [1, 1, 2],
+        'type': ['PAYMENT', 'TRANSFER', 'CASH_OUT'],
+        'amount': [9839.64, 181.0, 229133.94],
+        'nameOrig': ['C1231006815', 'C1305486145', 'C905080434'],
+        'oldbalanceOrg': [170136.0, 181.0, 15325.0],
+        'newbalanceOrig': [160296.36, 0.0, 0.0],
+        'nameDest': ['M1979787155', 'C553264065', 'C476402209'],
+        'oldbalanceDest': [0.0, 0.0, 5083.0],
+        'newbalanceDest': [0.0, 0.0, 51513.44],
+        'isFraud': [0, 1, 0],
+        'isFlaggedFraud': [0, 0, 0]
+    })
+
+    with tempfile.TemporaryDirectory() as source_dir:
+        csv_filename = os.path.join(source_dir, 'paysim.csv')
+        input_df.to_csv(csv_filename, index=False)
+
+        archive_filename = os.path.join(source_dir, 'paysim1.zip')
+        with zipfile.ZipFile(archive_filename, "w") as z:
+            z.write(csv_filename, 'paysim.csv')
+
+        config = {
+            'version': 2.0,
+            'competition': 'ealaxi/paysim1',
+            'archive_filename': 'paysim1.zip',
+            'csv_filename': 'paysim.csv',
+            'parquet_filename': 'synthetic_fraud.parquet',
+        }
+
+        def download_files(competition_name, path):
+            assert competition_name == 'ealaxi/paysim1'
+            copy(archive_filename, path)
+
+        with mock.patch('ludwig.datasets.base_dataset.read_config',
+                        return_value=config):
+            with mock.patch('ludwig.datasets.mixins.kaggle.create_kaggle_client') as mock_kaggle_cls:
+                mock_kaggle_api = mock.MagicMock()
+                mock_kaggle_api.dataset_download_files = download_files
+                mock_kaggle_cls.return_value = mock_kaggle_api
+
+                dataset = SyntheticFraud(cache_dir=tmpdir)
+                assert not dataset.is_downloaded()
+
+                dataset.download()
+                assert dataset.is_downloaded()
+
+                assert not dataset.is_processed()
+                if arrow_readable:
+                    dataset.process()
+                else:
+                    # files pyarrow can not parse are read with pandas
+                    with mock.patch(
+                            'ludwig.datasets.synthetic_fraud.read_csv_table',
+                            return_value=None):
+                        dataset.process()
+                assert dataset.is_processed()
+
+                # the raw CSV is not kept around next to the Parquet file
+                assert not os.path.exists(dataset.raw_dataset_path)
+                assert dataset.is_downloaded()
+
+                output_df = dataset.load()
+                pd.testing.assert_frame_equal(input_df, output_df)
@@ -8,7 +8,7 @@ import pytest
 from ludwig.datasets.base_dataset import BaseDataset
 from ludwig.datasets.mixins.download import ZipDownloadMixin, \
     UncompressedFileDownloadMixin
-from ludwig.datasets.mixins.load import CSVLoadMixin
+from ludwig.datasets.mixins.load import CSVLoadMixin, read_csv
 from ludwig.datasets.mixins.process import IdentityProcessMixin, \
     MultifileJoinProcessMixin
 
@@ -154,3 +154,32 @@ def test_multifile_join_dataset(f_type):
 
                 assert dataset.is_downloaded()
                 assert dataset.is_processed()
+
+
+@pytest.mark.parametrize('csv_content', [
+    # dates, missing values and a split column
+    'date,category,number,split\n'
+    '2021-01-01,a,1.5,0\n'
+    '2021-01-02,,,1\n'
+    '2021-01-03,c,3.0,2\n',
+    # times of day
+    'time,number\n'
+    '12:30:00,1\n'
+    '08:15:00,2\n',
+    # an unnamed index column
+    ',name\n'
+    '0,a\n'
+    '1,b\n',
+    # duplicate column names
+    'a,a,b\n'
+    '1,2,3\n'
+    '4,5,6\n',
+], ids=['dates', 'times', 'unnamed', 'duplicates'])
+def test_read_csv_keeps_pandas_semantics(csv_content):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = os.path.join(tmpdir, 'input.csv')
+        with open(csv_path, 'w') as f:
+            f.write(csv_content)
+
+        output_df = read_csv(csv_path)
+        pd.testing.assert_frame_equal(pd.read_csv(csv_path), output_df)
@@ -89,6 +89,9 @@ def test_download_titanic_dataset(tmpdir):
 
                 dataset.download()
                 assert dataset.is_downloaded()
+
+                # downloading again is a no-op
+                dataset.download()
                 mock_kaggle_api.authenticate.assert_called_once()
 
                 assert not dataset.is_processed()
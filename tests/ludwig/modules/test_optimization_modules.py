@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from ludwig.modules.optimization_modules import ClippedOptimizer
+
+
+def _minimize(optimizer, variable, multiplier):
+    with tf.GradientTape() as tape:
+        loss = tf.reduce_sum(variable * variable) * multiplier
+    optimizer.minimize_with_tape(tape, loss, [variable])
+
+
+@pytest.mark.parametrize('optimizer_params', [
+    {'type': 'sgd', 'momentum': 0.9},
+    {'type': 'adam'},
+])
+def test_loss_scale_skips_overflowing_step(optimizer_params):
+    optimizer = ClippedOptimizer(loss_scale=True, **optimizer_params)
+    variable = tf.Variable([1.0, 2.0])
+
+    # a finite step updates the weights and creates the optimizer slots
+    _minimize(optimizer, variable, 1.0)
+    assert not np.allclose(variable.numpy(), [1.0, 2.0])
+    assert optimizer.iterations.numpy() == 1
+
+    weights = variable.numpy()
+    optimizer_weights = [w.numpy() for w in optimizer.weights]
+    loss_scale = optimizer.loss_scale().numpy()
+
+    # an overflowing step leaves weights and optimizer state untouched,
+    # and only lowers the loss scale
+    _minimize(optimizer, variable, np.inf)
+    np.testing.assert_array_equal(variable.numpy(), weights)
+    for before, after in zip(optimizer_weights, optimizer.weights):
+        np.testing.assert_array_equal(after.numpy(), before)
+    assert optimizer.iterations.numpy() == 1
+    assert optimizer.loss_scale().numpy() < loss_scale
+
+    # training resumes with the next finite step
+    _minimize(optimizer, variable, 1.0)
+    assert not np.allclose(variable.numpy(), weights)
+    assert optimizer.iterations.numpy() == 2
+
+
+def test_loss_scale_unscales_gradients():
+    variable = tf.Variable([1.0, 2.0])
+    reference = tf.Variable([1.0, 2.0])
+
+    _minimize(
+        ClippedOptimizer(type='sgd', clipglobalnorm=None, loss_scale=True),
+        variable, 1.0
+    )
+    _minimize(ClippedOptimizer(type='sgd', clipglobalnorm=None),
+              reference, 1.0)
+
+    np.testing.assert_allclose(variable.numpy(), reference.numpy())
+
+
+def test_loss_scale_is_checkpointed(tmpdir):
+    optimizer = ClippedOptimizer(loss_scale=True)
+    variable = tf.Variable([1.0, 2.0])
+
+    # an overflowing step lowers the loss scale below its initial value
+    _minimize(optimizer, variable, np.inf)
+    loss_scale = optimizer.loss_scale().numpy()
+    checkpoint_path = tf.train.Checkpoint(optimizer=optimizer).save(
+        str(tmpdir.join('ckpt'))
+    )
+
+    restored = ClippedOptimizer(loss_scale=True)
+    assert restored.loss_scale().numpy() != loss_scale
+    tf.train.Checkpoint(optimizer=restored).restore(checkpoint_path)
+    assert restored.loss_scale().numpy() == loss_scale
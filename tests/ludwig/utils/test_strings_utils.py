@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.data.dataframe.pandas import PandasEngine
+from ludwig.utils import strings_utils
+from ludwig.utils.strings_utils import build_sequence_matrix
+
+VOCAB = ['[PAD]', '[UNK]', '[CLS]', '[SEP]', 'flights', 'from', 'to',
+         'boston', 'denver']
+
+
+class FakeHFTokenizer:
+    """Mimics a pretrained tokenizer with special tokens and truncation."""
+
+    max_length = 6
+
+    def __init__(self, **kwargs):
+        self.str2idx = {token: i for i, token in enumerate(VOCAB)}
+
+    def _encode(self, text):
+        ids = [self.str2idx.get(token, self.str2idx['[UNK]'])
+               for token in text.split()]
+        ids = ids[:self.max_length - 2]
+        return [self.str2idx['[CLS]']] + ids + [self.str2idx['[SEP]']]
+
+    def __call__(self, text):
+        return self._encode(text)
+
+    def batch_encode(self, texts):
+        return [self._encode(text) for text in texts]
+
+
+class PartitionedPandasEngine(PandasEngine):
+    """Takes the row by row path of a partitioned engine over pandas."""
+
+    @property
+    def partitioned(self):
+        return True
+
+
+@pytest.mark.parametrize('batch_encode_size', [3, 10000])
+@pytest.mark.parametrize('padding', ['right', 'left'])
+@pytest.mark.parametrize('lowercase', [True, False])
+def test_build_sequence_matrix_hf_batch_encode(padding, lowercase,
+                                               batch_encode_size):
+    sequences = pd.Series([
+        'Flights from Boston to Denver',
+        'flights to denver',
+        'from Boston',
+        'Flights from Boston to Denver to Boston',
+    ], index=[3, 5, 7, 9])
+
+    kwargs = dict(
+        inverse_vocabulary={token: i for i, token in enumerate(VOCAB)},
+        tokenizer_type='hf_tokenizer',
+        length_limit=8,
+        padding_symbol='[PAD]',
+        padding=padding,
+        lowercase=lowercase,
+        pretrained_model_name_or_path='fake',
+    )
+
+    with mock.patch.dict(strings_utils.tokenizer_registry,
+                         {'hf_tokenizer': FakeHFTokenizer}), \
+            mock.patch.object(strings_utils, 'HF_BATCH_ENCODE_SIZE',
+                              batch_encode_size):
+        with mock.patch.object(FakeHFTokenizer, '__call__',
+                               side_effect=FakeHFTokenizer._encode,
+                               autospec=True) as mock_call:
+            batched = build_sequence_matrix(sequences, **kwargs)
+            mock_call.assert_not_called()
+
+        row_by_row = build_sequence_matrix(
+            sequences, processor=PartitionedPandasEngine(), **kwargs)
+
+    assert batched.index.equals(sequences.index)
+    assert batched.index.equals(row_by_row.index)
+    for batched_ids, row_ids in zip(batched, row_by_row):
+        assert batched_ids.dtype == row_ids.dtype
+        np.testing.assert_array_equal(batched_ids, row_ids)
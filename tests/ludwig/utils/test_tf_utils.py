@@ -18,7 +18,7 @@ import contextlib
 from unittest.mock import Mock, patch
 
 from ludwig.utils.tf_utils import initialize_tensorflow, _get_tf_init_params, \
-    _set_tf_init_params
+    _set_tf_init_params, jit_compile_scope
 
 
 @contextlib.contextmanager
@@ -141,3 +141,18 @@ def test_initialize_tensorflow_with_horovod_explicit_gpus(mock_tf_config):
         initialize_tensorflow(gpus='-1', horovod=mock_hvd)
 
     mock_tf_config.set_visible_devices.assert_called_with([], 'GPU')
+
+
+@patch('ludwig.utils.tf_utils.tf.config')
+def test_jit_compile_scope(mock_tf_config):
+    mock_tf_config.optimizer.get_jit.return_value = False
+    with jit_compile_scope(True):
+        mock_tf_config.optimizer.set_jit.assert_called_once_with(True)
+    mock_tf_config.optimizer.set_jit.assert_called_with(False)
+
+
+@patch('ludwig.utils.tf_utils.tf.config')
+def test_jit_compile_scope_disabled(mock_tf_config):
+    with jit_compile_scope(False):
+        pass
+    mock_tf_config.optimizer.set_jit.assert_not_called()